@@ -5,7 +5,8 @@ Includes planetary data, orbital mechanics, and astronomical conversions.
 """
 
 import math
-from typing import Dict, Tuple, List
+from types import MappingProxyType
+from typing import Dict, Iterable, NamedTuple, Tuple, List
 
 # Astronomical Constants
 AU = 149597870.7  # Astronomical Unit in kilometers
@@ -13,6 +14,10 @@ G = 6.67430e-11  # Gravitational constant in m^3 kg^-1 s^-2
 SUN_MASS = 1.989e30  # Mass of the Sun in kilograms
 SOLAR_MASS_AU_YEAR = 4 * math.pi**2  # GM in AU^3/year^2
 
+# Report formatting
+SUMMARY_SEPARATOR = "=" * 80
+SUMMARY_RULE = "-" * 40
+
 # Planetary Data (approximate values)
 PLANETS = {
     'Mercury': {
@@ -82,6 +87,29 @@ PLANETS = {
 }
 
 
+class _PlanetRecord(NamedTuple):
+    """Packed, immutable row of planetary data (same fields as PLANETS)"""
+    distance_au: float
+    mass_earth: float
+    radius_km: float
+    day_hours: float
+    year_days: float
+    moons: int
+
+
+# PLANETS stays the public dict-of-dicts; calculations read these packed rows
+_PLANET_RECORDS = {
+    planet_name: _PlanetRecord(**planet) for planet_name, planet in PLANETS.items()
+}
+
+# Derived constants, bound once so the per-call math skips the lookups
+_EARTH_RADIUS_KM = PLANETS['Earth']['radius_km']
+_EARTH_ESCAPE_V = 11.186  # Earth escape velocity in km/s
+_AU_M = AU * 1000  # Astronomical Unit in meters
+_GM = G * SUN_MASS  # Sun's gravitational parameter in m^3 s^-2
+_V_1AU_KM_S = math.sqrt(_GM / _AU_M) / 1000  # Circular orbital velocity at 1 AU
+
+
 def orbital_period_kepler(semi_major_axis_au: float) -> float:
     """
     Calculate orbital period using Kepler's Third Law.
@@ -92,7 +120,7 @@ def orbital_period_kepler(semi_major_axis_au: float) -> float:
     Returns:
         Orbital period in Earth years
     """
-    return math.sqrt(semi_major_axis_au**3)
+    return math.sqrt(semi_major_axis_au * semi_major_axis_au * semi_major_axis_au)
 
 
 def orbital_velocity(semi_major_axis_au: float) -> float:
@@ -105,11 +133,63 @@ def orbital_velocity(semi_major_axis_au: float) -> float:
     Returns:
         Orbital velocity in km/s
     """
-    semi_major_axis_m = semi_major_axis_au * AU * 1000
-    velocity_m_s = math.sqrt(G * SUN_MASS / semi_major_axis_m)
+    semi_major_axis_m = semi_major_axis_au * _AU_M
+    velocity_m_s = math.sqrt(_GM / semi_major_axis_m)
     return velocity_m_s / 1000  # Convert to km/s
 
 
+def orbital_period_many(semi_major_axes_au: Iterable[float]) -> List[float]:
+    """
+    Calculate orbital periods for many semi-major axes at once.
+    
+    Args:
+        semi_major_axes_au: Semi-major axes in Astronomical Units
+    
+    Returns:
+        Orbital periods in Earth years, in input order
+    """
+    sqrt = math.sqrt
+    return [sqrt(a * a * a) for a in semi_major_axes_au]
+
+
+def orbital_velocity_many(semi_major_axes_au: Iterable[float]) -> List[float]:
+    """
+    Calculate circular orbital velocities for many semi-major axes at once.
+    
+    Args:
+        semi_major_axes_au: Semi-major axes in Astronomical Units
+    
+    Returns:
+        Orbital velocities in km/s, in input order
+    """
+    # v = sqrt(GM / (a * AU)) = v(1 AU) / sqrt(a), so only one sqrt per orbit
+    sqrt = math.sqrt
+    return [_V_1AU_KM_S / sqrt(a) for a in semi_major_axes_au]
+
+
+def orbital_period_velocity_many(
+    semi_major_axes_au: Iterable[float],
+) -> Tuple[List[float], List[float]]:
+    """
+    Calculate orbital periods and velocities for many semi-major axes in one pass.
+    
+    Args:
+        semi_major_axes_au: Semi-major axes in Astronomical Units
+    
+    Returns:
+        Tuple of (orbital periods in Earth years, orbital velocities in km/s)
+    """
+    sqrt = math.sqrt
+    periods = []
+    velocities = []
+    for a in semi_major_axes_au:
+        # sqrt(a**3) == a * sqrt(a), so one sqrt serves both quantities
+        root_a = sqrt(a)
+        periods.append(a * root_a)
+        velocities.append(_V_1AU_KM_S / root_a)
+    return periods, velocities
+
+
 def escape_velocity(planet_name: str) -> float:
     """
     Calculate escape velocity for a planet.
@@ -120,19 +200,18 @@ def escape_velocity(planet_name: str) -> float:
     Returns:
         Escape velocity in km/s
     """
-    if planet_name not in PLANETS:
-        raise ValueError(f"Planet {planet_name} not found")
-    
-    planet = PLANETS[planet_name]
-    radius_m = planet['radius_km'] * 1000
+    try:
+        planet = _PLANET_RECORDS[planet_name]
+    except KeyError:
+        raise ValueError(f"Planet {planet_name} not found") from None
+    radius_m = planet.radius_km * 1000
     
     # Escape velocity = sqrt(2*G*M/r)
     # Using Earth data to scale: Earth escape velocity ≈ 11.2 km/s
-    earth_escape_v = 11.186
-    mass_ratio = planet['mass_earth']
-    radius_ratio = planet['radius_km'] / PLANETS['Earth']['radius_km']
+    mass_ratio = planet.mass_earth
+    radius_ratio = planet.radius_km / _EARTH_RADIUS_KM
     
-    escape_v = earth_escape_v * math.sqrt(mass_ratio / radius_ratio)
+    escape_v = _EARTH_ESCAPE_V * math.sqrt(mass_ratio / radius_ratio)
     return escape_v
 
 
@@ -146,17 +225,19 @@ def surface_gravity(planet_name: str) -> float:
     Returns:
         Surface gravity as a multiple of Earth's gravity (g)
     """
-    if planet_name not in PLANETS:
-        raise ValueError(f"Planet {planet_name} not found")
-    
-    planet = PLANETS[planet_name]
-    mass_ratio = planet['mass_earth']
-    radius_ratio = planet['radius_km'] / PLANETS['Earth']['radius_km']
-    
-    gravity = mass_ratio / (radius_ratio**2)
+    try:
+        planet = _PLANET_RECORDS[planet_name]
+    except KeyError:
+        raise ValueError(f"Planet {planet_name} not found") from None
+    mass_ratio = planet.mass_earth
+    radius_ratio = planet.radius_km / _EARTH_RADIUS_KM
+    
+    gravity = mass_ratio / (radius_ratio * radius_ratio)
     return gravity
 
 
+# Public conversion helpers. Internal calculations multiply or divide by AU
+# inline rather than paying a function call for a single operation.
 def distance_au_to_km(distance_au: float) -> float:
     """
     Convert distance from Astronomical Units to kilometers.
@@ -183,9 +264,9 @@ def distance_km_to_au(distance_km: float) -> float:
     return distance_km / AU
 
 
-def planetary_info(planet_name: str) -> Dict:
+def _derive_info(planet_name: str) -> Dict:
     """
-    Get comprehensive information about a planet.
+    Compute the planetary data and derived values for a planet.
     
     Args:
         planet_name: Name of the planet
@@ -193,48 +274,74 @@ def planetary_info(planet_name: str) -> Dict:
     Returns:
         Dictionary with planetary data and calculated values
     """
-    if planet_name not in PLANETS:
-        raise ValueError(f"Planet {planet_name} not found")
-    
-    planet = PLANETS[planet_name]
+    d, m, r, day_hours, year_days, moons = _PLANET_RECORDS[planet_name]
+    rr = r / _EARTH_RADIUS_KM
     
     return {
         'name': planet_name,
-        'distance_au': planet['distance_au'],
-        'distance_km': distance_au_to_km(planet['distance_au']),
-        'orbital_period_years': orbital_period_kepler(planet['distance_au']),
-        'orbital_velocity_km_s': orbital_velocity(planet['distance_au']),
-        'radius_km': planet['radius_km'],
-        'surface_area_km2': 4 * math.pi * (planet['radius_km']**2),
-        'volume_km3': (4/3) * math.pi * (planet['radius_km']**3),
-        'mass_earth_masses': planet['mass_earth'],
-        'surface_gravity_g': surface_gravity(planet_name),
-        'escape_velocity_km_s': escape_velocity(planet_name),
-        'day_hours': planet['day_hours'],
-        'year_days': planet['year_days'],
-        'moons': planet['moons']
+        'distance_au': d,
+        'distance_km': d * AU,
+        'orbital_period_years': math.sqrt(d * d * d),
+        'orbital_velocity_km_s': math.sqrt(_GM / (d * _AU_M)) / 1000,
+        'radius_km': r,
+        'surface_area_km2': 4 * math.pi * (r * r),
+        'volume_km3': (4/3) * math.pi * (r * r * r),
+        'mass_earth_masses': m,
+        'surface_gravity_g': m / (rr * rr),
+        'escape_velocity_km_s': _EARTH_ESCAPE_V * math.sqrt(m / rr),
+        'day_hours': day_hours,
+        'year_days': year_days,
+        'moons': moons
     }
 
 
+def planetary_info(planet_name: str) -> Dict:
+    """
+    Get comprehensive information about a planet.
+    
+    Args:
+        planet_name: Name of the planet
+    
+    Returns:
+        Dictionary with planetary data and calculated values
+    """
+    try:
+        info = _DERIVED[planet_name]
+    except KeyError:
+        raise ValueError(f"Planet {planet_name} not found") from None
+    
+    # Copy so callers cannot modify the cached values
+    return dict(info)
+
+
+def _format_summary() -> str:
+    """
+    Build the text of the Solar System summary from the cached values.
+    
+    Returns:
+        Summary report for all planets
+    """
+    header = [SUMMARY_SEPARATOR, "SOLAR SYSTEM SUMMARY".center(80), SUMMARY_SEPARATOR]
+    blocks = [
+        f"\n{info['name'].upper()}\n"
+        f"{SUMMARY_RULE}\n"
+        f"  Distance from Sun: {info['distance_au']:.3f} AU ({info['distance_km']:.2e} km)\n"
+        f"  Orbital Period: {info['orbital_period_years']:.2f} years ({info['year_days']:.2f} days)\n"
+        f"  Orbital Velocity: {info['orbital_velocity_km_s']:.2f} km/s\n"
+        f"  Radius: {info['radius_km']:.0f} km\n"
+        f"  Mass: {info['mass_earth_masses']:.3f} Earth masses\n"
+        f"  Surface Gravity: {info['surface_gravity_g']:.2f}g\n"
+        f"  Escape Velocity: {info['escape_velocity_km_s']:.2f} km/s\n"
+        f"  Day Length: {info['day_hours']:.1f} hours\n"
+        f"  Moons: {info['moons']}"
+        for info in _DERIVED.values()
+    ]
+    return "\n".join(header + blocks)
+
+
 def solar_system_summary() -> None:
     """Print a summary of all planets in the Solar System."""
-    print("=" * 80)
-    print("SOLAR SYSTEM SUMMARY".center(80))
-    print("=" * 80)
-    
-    for planet_name in PLANETS.keys():
-        info = planetary_info(planet_name)
-        print(f"\n{planet_name.upper()}")
-        print("-" * 40)
-        print(f"  Distance from Sun: {info['distance_au']:.3f} AU ({info['distance_km']:.2e} km)")
-        print(f"  Orbital Period: {info['orbital_period_years']:.2f} years ({info['year_days']:.2f} days)")
-        print(f"  Orbital Velocity: {info['orbital_velocity_km_s']:.2f} km/s")
-        print(f"  Radius: {info['radius_km']:.0f} km")
-        print(f"  Mass: {info['mass_earth_masses']:.3f} Earth masses")
-        print(f"  Surface Gravity: {info['surface_gravity_g']:.2f}g")
-        print(f"  Escape Velocity: {info['escape_velocity_km_s']:.2f} km/s")
-        print(f"  Day Length: {info['day_hours']:.1f} hours")
-        print(f"  Moons: {info['moons']}")
+    print(_SUMMARY_TEXT)
 
 
 def habitability_check(planet_name: str) -> Dict:
@@ -247,17 +354,18 @@ def habitability_check(planet_name: str) -> Dict:
     Returns:
         Dictionary with habitability factors
     """
-    if planet_name not in PLANETS:
-        raise ValueError(f"Planet {planet_name} not found")
-    
-    info = planetary_info(planet_name)
+    # Read the cached values directly; planetary_info would copy the whole dict
+    try:
+        info = _DERIVED[planet_name]
+    except KeyError:
+        raise ValueError(f"Planet {planet_name} not found") from None
     
     # Simple criteria (highly simplified)
     in_habitable_zone = 0.95 < info['distance_au'] < 1.37
     suitable_gravity = 0.5 < info['surface_gravity_g'] < 2.0
-    has_stable_orbit = True
     
-    score = sum([in_habitable_zone, suitable_gravity, has_stable_orbit])
+    # Booleans add as ints; the trailing 1 counts the (always) stable orbit
+    score = in_habitable_zone + suitable_gravity + 1
     
     return {
         'planet': planet_name,
@@ -268,6 +376,15 @@ def habitability_check(planet_name: str) -> Dict:
     }
 
 
+# Planetary data is constant, so every derived value is computed once at import
+_DERIVED = MappingProxyType({
+    planet_name: _derive_info(planet_name) for planet_name in PLANETS
+})
+
+# The summary depends only on the cached values, so it is formatted once too
+_SUMMARY_TEXT = _format_summary()
+
+
 if __name__ == "__main__":
     # Example usage
     print("Solar System Calculator")